@@ -6,7 +6,7 @@ sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 import wave
 import numpy as np
-from simulator.audio.equalizer import Equalizer
+from simulator.audio.equalizer import Equalizer10Band
 
 wav = wave.open("example_audio/test.wav", "rb")
 
@@ -14,7 +14,7 @@ sample_rate = wav.getframerate()
 frames = wav.readframes(1024)
 samples = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
 
-eq = Equalizer(sample_rate)
+eq = Equalizer10Band(sample_rate)
 bands = eq.process(samples)
 
 print(bands)
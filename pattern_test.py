@@ -1,7 +1,8 @@
-from simulator.leds.patterns import eq_to_rgb_pattern
+from simulator.leds.patterns import blended_eq_pattern
 
-bands = {"bass": 0.8, "mid": 0.4, "treble": 0.2}
-colors = eq_to_rgb_pattern(bands, led_count=5)
+# Bass-heavy test: strong low bands, fading toward treble
+bands = [0.8, 0.8, 0.6, 0.4, 0.4, 0.3, 0.2, 0.2, 0.1, 0.1]
+colors = blended_eq_pattern(bands, led_count=5)
 
 for i, c in enumerate(colors):
     print(f"LED {i}: RGB{c}")
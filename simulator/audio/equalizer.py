@@ -2,11 +2,17 @@
 
 import numpy as np
 
+# 2048 points at 44.1 kHz gives ~21.5 Hz bins, the coarsest that still puts
+# a bin inside the 20-40 Hz band.
+DEFAULT_FFT_SIZE = 2048
+
+
 class Equalizer10Band:
-    def __init__(self, sample_rate: int, fft_size: int = 1024):
+    def __init__(self, sample_rate: int, fft_size: int = DEFAULT_FFT_SIZE):
         self.sample_rate = sample_rate
         self.fft_size = fft_size
         self.freqs = np.fft.rfftfreq(fft_size, d=1.0 / sample_rate)
+        self.window = np.hanning(fft_size)
 
         # Define 10 logarithmic bands (frequencies in Hz)
         self.bands = [
@@ -22,24 +28,19 @@ class Equalizer10Band:
             (10000, 20000)
         ]
 
-    def _band_energy(self, spectrum, band):
-        low, high = band
-        idx = np.where((self.freqs >= low) & (self.freqs < high))[0]
-        if len(idx) == 0:
-            return 0.0
-        return np.mean(spectrum[idx])
+        # FFT bin indices per band, looked up once instead of every chunk
+        self.band_bins = [np.flatnonzero((self.freqs >= low) & (self.freqs < high))
+                          for low, high in self.bands]
 
-    def process(self, samples: np.ndarray):
-        if len(samples) < self.fft_size:
-            samples = np.pad(samples, (0, self.fft_size - len(samples)))
+        # Most recent fft_size samples; chunks shorter than the FFT overlap
+        self._history = np.zeros(fft_size, dtype=np.float32)
 
-        samples = samples[:self.fft_size]
-        window = np.hanning(len(samples))
-        samples = samples * window
-        spectrum = np.abs(np.fft.rfft(samples))
+    def process(self, samples: np.ndarray):
+        self._history = np.concatenate((self._history, samples))[-self.fft_size:]
+        spectrum = np.abs(np.fft.rfft(self._history * self.window))
 
         # Compute band energies
-        energies = [self._band_energy(spectrum, band) for band in self.bands]
+        energies = [spectrum[idx].mean() if len(idx) else 0.0 for idx in self.band_bins]
 
         # Normalize (max of all bands to 1.0)
         max_energy = max(max(energies), 1e-6)
@@ -0,0 +1,111 @@
+# simulator/leds/glow.py
+
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+GLOW_SCALE = 3.0       # glow reaches this many LED radii out
+DOWNSAMPLE = 6         # glow layer is rendered at 1/DOWNSAMPLE resolution
+MAX_CACHED_KERNELS = 8
+
+
+def make_glow_sprite(radius, glow_scale=GLOW_SCALE):
+    """
+    Returns a float32 intensity map (0.0-1.0) for one diffused LED:
+    a bright core of `radius` pixels with a soft falloff around it.
+    """
+    extent = int(np.ceil(radius * glow_scale))
+    size = extent * 2 + 1
+    ys, xs = np.mgrid[0:size, 0:size]
+    dist = np.hypot(xs - extent, ys - extent) / max(radius, 1e-3)
+
+    core = np.clip(1.5 - dist, 0.0, 1.0)
+    halo = np.exp(-(dist ** 2) / 1.8) * 0.6
+    intensity = np.clip(core + halo, 0.0, 1.0)
+
+    # Fade the halo to zero at the sprite edge so sprites don't show boxes
+    edge = np.clip((glow_scale - dist) / (glow_scale * 0.25), 0.0, 1.0)
+    return (intensity * edge).astype(np.float32)
+
+
+def _fft_size(n):
+    return -(-n // 16) * 16
+
+
+class GlowRenderer:
+    """
+    Draws LEDs as additive glow on a low-resolution layer. Every LED's color
+    is splatted onto the layer in one pass, the layer is convolved with the
+    precomputed glow sprite (via FFT), then scaled up and added to the
+    screen with a single blit. Cost depends on the lit area, not LED count.
+    """
+
+    def __init__(self, glow_scale=GLOW_SCALE, downsample=DOWNSAMPLE):
+        self.glow_scale = glow_scale
+        self.downsample = downsample
+        self._kernels = OrderedDict()
+
+    def _kernel(self, shape, radius):
+        """FFT of the glow sprite, zero-padded to `shape` and centred on (0, 0)."""
+        key = (shape, radius, self.downsample, self.glow_scale)
+        kernel = self._kernels.get(key)
+        if kernel is not None:
+            self._kernels.move_to_end(key)
+            return kernel
+
+        sprite = make_glow_sprite(radius / self.downsample, self.glow_scale)
+        extent = sprite.shape[0] // 2
+        padded = np.zeros(shape, dtype=np.float32)
+        padded[:sprite.shape[0], :sprite.shape[1]] = sprite
+        padded = np.roll(padded, (-extent, -extent), axis=(0, 1))
+        kernel = np.fft.rfft2(padded)
+
+        self._kernels[key] = kernel
+        if len(self._kernels) > MAX_CACHED_KERNELS:
+            self._kernels.popitem(last=False)
+        return kernel
+
+    def draw(self, screen, positions, colors, radius):
+        """Blend one glow per LED onto `screen` at the given centre positions."""
+        if not len(positions):
+            return
+
+        ds = self.downsample
+        pos = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        rgb = np.asarray(colors, dtype=np.float32).reshape(-1, 3)
+        lit = rgb.any(axis=1)
+        if not lit.any():
+            return
+        pos, rgb = pos[lit], rgb[lit]
+
+        # Layer covers the lit LEDs plus the glow reach, in low-res pixels
+        extent = int(np.ceil(radius * self.glow_scale / ds)) + 1
+        x0, y0 = np.floor(pos.min(axis=0) / ds).astype(int) - extent
+        x1, y1 = np.floor(pos.max(axis=0) / ds).astype(int) + extent + 1
+        w, h = x1 - x0 + 1, y1 - y0 + 1
+        shape = (_fft_size(w), _fft_size(h))
+
+        # Bilinear splat keeps sub-pixel LED positions on the coarse grid
+        gx = pos[:, 0] / ds - x0 - 0.5
+        gy = pos[:, 1] / ds - y0 - 0.5
+        ix, iy = np.floor(gx).astype(np.intp), np.floor(gy).astype(np.intp)
+        fx, fy = gx - ix, gy - iy
+
+        cells = shape[0] * shape[1]
+        corners = [(0, 0, (1 - fx) * (1 - fy)), (1, 0, fx * (1 - fy)),
+                   (0, 1, (1 - fx) * fy), (1, 1, fx * fy)]
+        index = np.concatenate([
+            c * cells + (ix + dx) * shape[1] + (iy + dy)
+            for c in range(3) for dx, dy, _ in corners
+        ])
+        weight = np.concatenate([rgb[:, c] * wt for c in range(3) for _, _, wt in corners])
+        layer = np.bincount(index, weights=weight, minlength=3 * cells)
+        layer = layer.astype(np.float32).reshape(3, *shape)
+
+        glow = np.fft.irfft2(np.fft.rfft2(layer) * self._kernel(shape, radius), s=shape)
+        glow = np.clip(glow[:, :w, :h], 0, 255).astype(np.uint8)
+
+        surf = pygame.surfarray.make_surface(glow.transpose(1, 2, 0))
+        surf = pygame.transform.smoothscale(surf, (w * ds, h * ds))
+        screen.blit(surf, (x0 * ds, y0 * ds), special_flags=pygame.BLEND_ADD)
@@ -0,0 +1,167 @@
+# simulator/leds/timing.py
+
+import json
+import argparse
+
+# Per-LED shift time and end-of-frame latch/reset time, in microseconds.
+PROTOCOLS = {
+    "ws2812": {"led_us": 30.0, "reset_us": 280.0},
+    "ws2811": {"led_us": 30.0, "reset_us": 280.0},
+    "sk6812": {"led_us": 30.0, "reset_us": 80.0},
+    "apa102": {"led_us": 4.0, "reset_us": 0.0},  # 32 bits @ 8 MHz SPI
+}
+
+
+class TargetRateError(ValueError):
+    """The requested frame rate can't be met even by a single-LED chain."""
+
+
+def positive_int(value):
+    """argparse type for channel counts that must be at least 1."""
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def non_negative_int(value):
+    """argparse type for counts where 0 means off."""
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {n}")
+    return n
+
+
+def _protocol(protocol):
+    if protocol not in PROTOCOLS:
+        raise ValueError(f"Unknown LED protocol: {protocol}")
+    return PROTOCOLS[protocol]
+
+
+def string_refresh_time(led_count, protocol="ws2812"):
+    """Seconds needed to shift out and latch one chain of `led_count` LEDs."""
+    p = _protocol(protocol)
+    return (led_count * p["led_us"] + p["reset_us"]) / 1e6
+
+
+def channel_refresh_time(strings, protocol="ws2812"):
+    """
+    Seconds for one output channel to refresh all of its strings.
+    Strings sharing a channel are driven back to back as one chain.
+    """
+    return string_refresh_time(sum(count for _, _, count in strings), protocol)
+
+
+def max_leds_per_channel(target_fps, protocol="ws2812"):
+    """Largest chain length that still refreshes at `target_fps`."""
+    p = _protocol(protocol)
+    budget_us = 1e6 / target_fps - p["reset_us"]
+    return max(int(budget_us // p["led_us"]), 0)
+
+
+def split_strings(string_map, max_leds):
+    """
+    Cut any string longer than `max_leds` into consecutive segments.
+    Segments keep their LED range, so they still index into the flat LED list.
+    """
+    if max_leds <= 0:
+        raise TargetRateError("Target frame rate is too high for this protocol")
+
+    segments = []
+    for name, start, count in string_map:
+        if count <= max_leds:
+            segments.append((name, start, count))
+            continue
+        for part, offset in enumerate(range(0, count, max_leds)):
+            segments.append((f"{name}[{part}]", start + offset, min(max_leds, count - offset)))
+    return segments
+
+
+def partition_strings(string_map, channels, protocol="ws2812", target_fps=None):
+    """
+    Spread strings over `channels` outputs so the slowest channel is as fast
+    as possible (longest string first onto the least loaded channel).
+
+    If `target_fps` is given, strings too long to refresh at that rate on
+    their own are split first. Returns a plan dict:
+        {"channels": [[(name, start, count), ...], ...],
+         "channel_times": [seconds, ...], "fps": float, "meets_target": bool}
+    """
+    if channels < 1:
+        raise ValueError("Need at least one output channel")
+
+    strings = list(string_map)
+    if target_fps:
+        strings = split_strings(strings, max_leds_per_channel(target_fps, protocol))
+
+    assigned = [[] for _ in range(channels)]
+    loads = [0] * channels
+    for string in sorted(strings, key=lambda s: s[2], reverse=True):
+        ch = loads.index(min(loads))
+        assigned[ch].append(string)
+        loads[ch] += string[2]
+
+    times = [channel_refresh_time(ch, protocol) if ch else 0.0 for ch in assigned]
+    slowest = max(times)
+    fps = 1.0 / slowest if slowest > 0 else float("inf")
+
+    return {
+        "channels": assigned,
+        "channel_times": times,
+        "fps": fps,
+        "meets_target": target_fps is None or fps >= target_fps,
+    }
+
+
+def channel_led_indices(plan, led_count):
+    """Flat LED indices driven by each channel of a partition_strings() plan."""
+    return [
+        [i for _, start, count in ch_strings for i in range(start, min(start + count, led_count))]
+        for ch_strings in plan["channels"]
+    ]
+
+
+def load_string_map(config_path):
+    """Build a (name, start, count) string map straight from a layout config."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+
+    string_map = []
+    start = 0
+    for string in cfg.get("strings", []):
+        count = len(string.get("leds", []))
+        string_map.append((string.get("name", f"string{len(string_map)}"), start, count))
+        start += count
+    return string_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check whether an LED layout can hit a frame rate.")
+    parser.add_argument("config", help="layout config JSON (same format as the visualizer)")
+    parser.add_argument("--protocol", default="ws2812", choices=sorted(PROTOCOLS))
+    parser.add_argument("--channels", type=positive_int, default=1)
+    parser.add_argument("--fps", type=float, default=None, help="target frame rate")
+    args = parser.parse_args()
+
+    string_map = load_string_map(args.config)
+    for name, _, count in string_map:
+        t = string_refresh_time(count, args.protocol)
+        fps = 1.0 / t if t > 0 else float("inf")
+        print(f"{name}: {count} LEDs, {t * 1000:.2f} ms, {fps:.1f} fps alone")
+
+    try:
+        plan = partition_strings(string_map, args.channels, args.protocol, args.fps)
+    except TargetRateError as e:
+        print(f"[WARN] {e} ({args.fps:.1f} fps with {args.protocol}); partitioning without a target")
+        plan = partition_strings(string_map, args.channels, args.protocol)
+    for ch, (strings, t) in enumerate(zip(plan["channels"], plan["channel_times"])):
+        names = ", ".join(name for name, _, _ in strings) or "-"
+        print(f"Channel {ch}: {t * 1000:.2f} ms  [{names}]")
+
+    print(f"Achievable: {plan['fps']:.1f} fps")
+    if args.fps and plan["fps"] < args.fps:
+        print(f"[WARN] Cannot reach {args.fps:.1f} fps with {args.channels} channel(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,12 @@
 import os
 import json
+import time
+from collections import deque
 import pygame
 
+from simulator.leds.timing import partition_strings, channel_led_indices
+from simulator.leds.glow import GlowRenderer, DOWNSAMPLE
+
 LED_RADIUS = 10
 DEFAULT_CONFIG = os.path.join("visualizations", "demo_config.json")
 
@@ -12,7 +17,7 @@ BORDER_COLOR = (255, 255, 255)
 
 
 class LEDVisualizer:
-    def __init__(self, shared, config_path=None):
+    def __init__(self, shared, config_path=None, glow=False):
         pygame.init()
         pygame.font.init()
 
@@ -33,6 +38,11 @@ class LEDVisualizer:
         self.large_font = pygame.font.SysFont("Segoe UI Emoji", 28)
         self.index_font = pygame.font.SysFont("Segoe UI Emoji", 14)
 
+        self.glow = GlowRenderer() if glow else None
+        self._glow_renderer = self.glow
+        self.show_labels = True
+        self._scaled_bg = None
+
         self.slider_rect = None
         self.button_rects = {}
         self.clock = pygame.time.Clock()
@@ -40,6 +50,11 @@ class LEDVisualizer:
         self.dragging_led = None
         self.dirty = False
 
+        self.timing_plan = None
+        self._channels = None          # [(refresh_time, led indices), ...] while simulating
+        self._latency_start = 0.0
+        self._frame_history = deque(maxlen=64)
+
     def _load_config(self):
         with open(self.config_path, "r", encoding="utf-8") as f:
             cfg = json.load(f)
@@ -94,11 +109,58 @@ class LEDVisualizer:
             json.dump(data, f, indent=2)
         self.dirty = False
 
+    def simulate_latency(self, channels=1, protocol="ws2812", target_fps=None):
+        """
+        Preview LEDs the way the real wiring would show them: each channel
+        latches at most once per refresh time and holds its last frame, so
+        slow or unequal channels drop frames and tear against each other.
+        Pass channels=0 to turn off.
+        """
+        self._frame_history.clear()
+        if not channels:
+            self._channels = None
+            self.timing_plan = None
+            return None
+
+        self.timing_plan = partition_strings(self.string_map, channels, protocol, target_fps)
+        indices = channel_led_indices(self.timing_plan, len(self.leds))
+        self._channels = [(t, idx) for t, idx in zip(self.timing_plan["channel_times"], indices) if idx]
+        self._latency_start = time.perf_counter()
+        return self.timing_plan
+
+    def apply_quality(self, settings):
+        """Apply a FrameGovernor quality level (labels, glow, glow_downsample)."""
+        self.glow = self._glow_renderer if settings.get("glow", True) else None
+        self.show_labels = settings.get("labels", True)
+        if self._glow_renderer:
+            self._glow_renderer.downsample = settings.get("glow_downsample", DOWNSAMPLE)
+
     def update_leds(self, colors):
+        if self._channels is not None:
+            # Only queue the frame; draw() decides what each channel has latched
+            self._frame_history.append((time.perf_counter(), list(colors)))
+            return
+
         for i, c in enumerate(colors):
             if i < len(self.leds):
                 self.leds[i]["color"] = c
 
+    def _latch_channels(self, now):
+        for refresh, indices in self._channels:
+            # The channel streams back to back: a transmission starts every
+            # `refresh` seconds with the newest frame, and latches when done.
+            latches = int((now - self._latency_start) // refresh)
+            if latches < 1:
+                continue
+            tx_start = self._latency_start + (latches - 1) * refresh
+
+            frame = next((f for sent, f in reversed(self._frame_history) if sent <= tx_start), None)
+            if frame is None:
+                continue
+            for i in indices:
+                if i < len(frame):
+                    self.leds[i]["color"] = frame[i]
+
     def handle_events(self):
         clicked = None
         seek_drag = False
@@ -164,6 +226,9 @@ class LEDVisualizer:
         return led_x, led_y
 
     def draw(self):
+        if self._channels is not None:
+            self._latch_channels(time.perf_counter())
+
         win_w, win_h = self.screen.get_size()
         img_space_h = win_h - self.control_panel_height
 
@@ -177,15 +242,22 @@ class LEDVisualizer:
         img_y = 0
         self.image_rect = (img_x, img_y, scale_w, scale_h)
 
-        scaled_bg = pygame.transform.smoothscale(self.bg_image, (scale_w, scale_h))
-        self.screen.blit(scaled_bg, (img_x, img_y))
+        # Rescaling the background only needs to happen when the window size changes
+        if self._scaled_bg is None or self._scaled_bg.get_size() != (scale_w, scale_h):
+            self._scaled_bg = pygame.transform.smoothscale(self.bg_image, (scale_w, scale_h))
+        self.screen.blit(self._scaled_bg, (img_x, img_y))
 
-        for led in self.leds:
-            x, y = self._led_screen_position(led)
-            color = led["default_color"] if self.shared.is_paused else led["color"]
-            pygame.draw.circle(self.screen, color, (x, y), LED_RADIUS)
+        positions = [self._led_screen_position(led) for led in self.leds]
+        colors = [led["default_color"] if self.shared.is_paused else led["color"] for led in self.leds]
+
+        if self.glow:
+            self.glow.draw(self.screen, positions, colors, LED_RADIUS)
+        else:
+            for pos, color in zip(positions, colors):
+                pygame.draw.circle(self.screen, color, pos, LED_RADIUS)
 
-            if self.shared.is_paused:
+        if self.shared.is_paused and self.show_labels:
+            for led, (x, y), color in zip(self.leds, positions, colors):
                 r, g, b = color
                 brightness = 0.299 * r + 0.587 * g + 0.114 * b
                 font_color = (0, 0, 0) if brightness > 128 else (255, 255, 255)
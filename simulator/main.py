@@ -1,6 +1,7 @@
 import os
 import re
 import time
+import argparse
 import pygame
 import numpy as np
 from pydub import AudioSegment
@@ -8,8 +9,10 @@ import simpleaudio as sa
 
 from simulator.audio.equalizer import Equalizer10Band
 from simulator.leds.visualizer import LEDVisualizer
+from simulator.leds.timing import PROTOCOLS, TargetRateError, non_negative_int
 from simulator.leds.patterns import blended_eq_pattern
-from simulator.effects.oneshot import EFFECT_MAP
+from simulator.effects import EFFECT_MAP
+from simulator.sync.governor import FrameGovernor, frame_budget
 
 AUDIO_DIR = "audio_library"
 CHUNK = 1024
@@ -49,7 +52,19 @@ def load_audio(fname):
     return samples, audio.frame_rate
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Cosplay Fireworks simulator")
+    parser.add_argument("--sim-channels", type=non_negative_int, default=0,
+                        help="preview LED output latency over this many channels (0 = off)")
+    parser.add_argument("--protocol", default="ws2812", choices=sorted(PROTOCOLS),
+                        help="LED protocol used for the latency preview")
+    parser.add_argument("--target-fps", type=float, default=None,
+                        help="split strings to hit this rate in the latency preview")
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     playlist = get_playlist()
     if not playlist:
         print("[ERROR] No valid MP3 files found in 'audio_library' folder.")
@@ -68,6 +83,7 @@ def main():
 
     index = 0
     samples, sr = load_audio(playlist[index])
+    governor = FrameGovernor(frame_budget(CHUNK, sr))
     eq = Equalizer10Band(sr)
     position = 0
     playback = None
@@ -84,10 +100,20 @@ def main():
                 playback = None
 
     state.current_track_name = playlist[index]
-    visualizer = LEDVisualizer(state, cfg_path)
+    visualizer = LEDVisualizer(state, cfg_path, glow=True)
+
+    if args.sim_channels:
+        try:
+            plan = visualizer.simulate_latency(args.sim_channels, args.protocol, args.target_fps)
+        except TargetRateError as e:
+            print(f"[WARN] {e}; simulating latency without a target frame rate")
+            plan = visualizer.simulate_latency(args.sim_channels, args.protocol)
+        print(f"[INFO] Simulating {args.sim_channels} {args.protocol} channel(s): "
+              f"{plan['fps']:.1f} fps achievable")
 
     running = True
     while running:
+        governor.begin_frame()
         clicked, seek_drag = visualizer.handle_events()
 
         if clicked:
@@ -179,7 +205,15 @@ def main():
 
         state.seek_position = position / len(samples)
         visualizer.draw()
-        time.sleep(CHUNK / sr)
+
+        if governor.end_frame():
+            decision = governor.decisions[-1]
+            print(f"[GOVERNOR] {decision['from']} -> {decision['to']} ({decision['reason']}, "
+                  f"{decision['frame_ms']:.1f} ms / {decision['budget_ms']:.1f} ms)")
+            visualizer.apply_quality(governor.settings)
+
+        # Sleep only what's left of this chunk so the lights don't drift behind the audio
+        time.sleep(max(CHUNK / sr - governor.last_frame, 0.0))
 
     if playback:
         playback.stop()
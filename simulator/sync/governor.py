@@ -0,0 +1,137 @@
+import time
+from collections import deque
+
+from simulator.leds.glow import DOWNSAMPLE
+
+# Highest quality first; each step drops the next cheapest-to-lose feature.
+# Audio analysis is never degraded: smaller FFTs leave the bass bands empty.
+QUALITY_LEVELS = [
+    {"name": "full",        "labels": True,  "glow": True,  "glow_downsample": DOWNSAMPLE},
+    {"name": "no-labels",   "labels": False, "glow": True,  "glow_downsample": DOWNSAMPLE},
+    {"name": "coarse-glow", "labels": False, "glow": True,  "glow_downsample": DOWNSAMPLE * 2},
+    {"name": "no-glow",     "labels": False, "glow": False, "glow_downsample": DOWNSAMPLE * 2},
+]
+
+
+def frame_budget(chunk, sample_rate, render_fps=60):
+    """
+    Seconds one loop iteration may take: it has to keep up with the audio
+    (one chunk per frame) and with the render rate, whichever is tighter.
+    """
+    budget = chunk / sample_rate
+    if render_fps:
+        budget = min(budget, 1.0 / render_fps)
+    return budget
+
+
+class FrameGovernor:
+    """
+    Tracks smoothed frame time against a budget and steps through
+    QUALITY_LEVELS: down after `downgrade_after` frames over budget, back up
+    after `upgrade_after` frames under `headroom * budget`. The smoothed
+    frame time restarts at every level change so the new level is judged on
+    its own cost. A step up undone within `retry_window` frames doubles the
+    wait before the next attempt; a step up that holds halves it again.
+    """
+
+    def __init__(self, budget, levels=QUALITY_LEVELS, downgrade_after=5,
+                 upgrade_after=90, headroom=0.6, smoothing=0.2, history=50,
+                 retry_window=30):
+        self.budget = budget
+        self.levels = levels
+        self.downgrade_after = downgrade_after
+        self.upgrade_after = upgrade_after
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self.retry_window = retry_window
+
+        self.level = 0
+        self.frame_time = 0.0        # smoothed, seconds
+        self.last_frame = 0.0        # raw, seconds
+        self.decisions = deque(maxlen=history)
+
+        self._over = 0
+        self._under = 0
+        self._upgrade_wait = upgrade_after
+        self._since_upgrade = None
+        self._frame_start = None
+
+    @property
+    def settings(self):
+        """Settings dict for the current quality level."""
+        return self.levels[self.level]
+
+    def begin_frame(self):
+        self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Record the time since begin_frame(). Returns True if the level changed."""
+        if self._frame_start is None:
+            return False
+        elapsed = time.perf_counter() - self._frame_start
+        self._frame_start = None
+        return self.record(elapsed)
+
+    def record(self, elapsed):
+        """Feed one frame time (seconds). Returns True if the level changed."""
+        self.last_frame = elapsed
+        if self._since_upgrade is not None:
+            self._since_upgrade += 1
+            if self._since_upgrade > self.retry_window:
+                # The step up held, so the next one needn't wait as long
+                self._upgrade_wait = max(self._upgrade_wait // 2, self.upgrade_after)
+                self._since_upgrade = None
+
+        if self.frame_time:
+            self.frame_time += self.smoothing * (elapsed - self.frame_time)
+        else:
+            self.frame_time = elapsed
+
+        if self.frame_time > self.budget:
+            self._over += 1
+            self._under = 0
+        elif self.frame_time < self.budget * self.headroom:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+
+        if self._over >= self.downgrade_after and self.level < len(self.levels) - 1:
+            return self._set_level(self.level + 1, "over budget")
+        if self._under >= self._upgrade_wait and self.level > 0:
+            return self._set_level(self.level - 1, "headroom")
+        return False
+
+    def _set_level(self, level, reason):
+        if level < self.level:
+            self._since_upgrade = 0
+        else:
+            if self._since_upgrade is not None:
+                self._upgrade_wait = min(self._upgrade_wait * 2, self.upgrade_after * 16)
+            self._since_upgrade = None
+
+        self.decisions.append({
+            "time": time.time(),
+            "from": self.levels[self.level]["name"],
+            "to": self.levels[level]["name"],
+            "reason": reason,
+            "frame_ms": self.frame_time * 1000,
+            "budget_ms": self.budget * 1000,
+        })
+        self.level = level
+        self.frame_time = 0.0
+        self._over = 0
+        self._under = 0
+        return True
+
+    def stats(self):
+        """Snapshot for logging/tuning."""
+        return {
+            "level": self.level,
+            "name": self.settings["name"],
+            "frame_ms": self.frame_time * 1000,
+            "budget_ms": self.budget * 1000,
+            "upgrade_wait": self._upgrade_wait,
+            "load": self.frame_time / self.budget if self.budget else 0.0,
+        }
@@ -0,0 +1,216 @@
+import os
+import json
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import numpy as np
+import pygame
+import pytest
+
+from simulator.leds.visualizer import LEDVisualizer
+
+SAMPLE_RATE = 44100
+BENCH_RETRIES = 2
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "benchmarks", "baselines.json")
+
+
+def pytest_addoption(parser):
+    parser.addoption("--update-baselines", action="store_true",
+                     help="record benchmark timings as the new baselines")
+    parser.addoption("--bench-tolerance", type=float,
+                     default=float(os.environ.get("BENCH_TOLERANCE", "2.0")),
+                     help="fail a benchmark slower than baseline * tolerance")
+    parser.addoption("--check-frame-budget", action="store_true",
+                     help="also fail large draw benchmarks over an absolute 60 fps frame "
+                          "(wall-clock; only meaningful on an idle machine)")
+
+
+# ---------------------------------------------------------------------------
+# Synthetic signals
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def sample_rate():
+    return SAMPLE_RATE
+
+
+@pytest.fixture
+def sine():
+    def make(freq, n, sr=SAMPLE_RATE, amplitude=10000.0):
+        t = np.arange(n) / sr
+        return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+    return make
+
+
+@pytest.fixture
+def sine_sweep():
+    """Logarithmic sweep from f0 to f1 Hz."""
+    def make(f0, f1, n, sr=SAMPLE_RATE, amplitude=10000.0):
+        t = np.arange(n) / sr
+        duration = n / sr
+        k = np.log(f1 / f0)
+        phase = 2 * np.pi * f0 * duration / k * (np.exp(t / duration * k) - 1)
+        return (amplitude * np.sin(phase)).astype(np.float32)
+    return make
+
+
+@pytest.fixture
+def pink_noise():
+    """1/f noise, shaped in the frequency domain from white noise."""
+    def make(n, sr=SAMPLE_RATE, amplitude=10000.0, seed=0):
+        rng = np.random.default_rng(seed)
+        spectrum = np.fft.rfft(rng.standard_normal(n))
+        freqs = np.fft.rfftfreq(n, d=1.0 / sr)
+        scale = np.ones_like(freqs)
+        scale[1:] = 1.0 / np.sqrt(freqs[1:])
+        scale[0] = 0.0
+        noise = np.fft.irfft(spectrum * scale, n)
+        return (amplitude * noise / np.max(np.abs(noise))).astype(np.float32)
+    return make
+
+
+@pytest.fixture
+def leds():
+    """A 10x10 grid of LED dicts shaped like LEDVisualizer.leds."""
+    return [
+        {"x_pct": x / 9, "y_pct": y / 9, "color": (0, 0, 0),
+         "default_color": (0, 0, 0), "index": x, "string": f"row{y}"}
+        for y in range(10) for x in range(10)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Headless visualizer
+# ---------------------------------------------------------------------------
+
+class _DemoState:
+    seek_position = 0.0
+    current_track_name = "test"
+    is_paused = False
+    edit_mode = False
+    in_effect = False
+
+
+class _UnthrottledClock:
+    """Stands in for pygame's Clock so draw() isn't capped at 60 fps."""
+
+    def tick(self, framerate=0):
+        return 0
+
+
+@pytest.fixture
+def make_visualizer(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "visualizations").mkdir()
+
+    def make(led_count=100, strings=4, glow=False):
+        pygame.init()
+        pygame.image.save(pygame.Surface((400, 600)), str(tmp_path / "visualizations" / "demo_config.png"))
+
+        per_string = led_count // strings
+        cfg = {
+            "background": "demo_config.png",
+            "strings": [
+                {
+                    "name": f"string{s}",
+                    "default_color": [0, 0, 255],
+                    "leds": [{"x": i / max(per_string, 1), "y": s / strings} for i in range(per_string)],
+                }
+                for s in range(strings)
+            ],
+            "buttons": [{"label": "Flash"}],
+        }
+        cfg_path = tmp_path / "visualizations" / "demo_config.json"
+        cfg_path.write_text(json.dumps(cfg), encoding="utf-8")
+
+        vis = LEDVisualizer(_DemoState(), str(cfg_path), glow=glow)
+        vis.clock = _UnthrottledClock()
+        return vis
+
+    yield make
+    pygame.quit()
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+_new_baselines = {}
+
+
+def _calibration_loop():
+    total = 0
+    for i in range(2000):
+        total += i * i
+    return total
+
+
+def _calibrate():
+    """Seconds for a fixed pure-Python workload, to rescale baselines to this machine."""
+    return min(timeit.repeat(_calibration_loop, number=50, repeat=5)) / 50
+
+
+def _load_baselines():
+    if not os.path.exists(BASELINE_PATH):
+        return {}
+    with open(BASELINE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def benchmark(request):
+    """
+    benchmark(name, fn, number=100) times fn (best of 5 repeats, seconds per
+    call) and fails if it stays slower than the stored baseline * tolerance
+    after re-measuring.
+    Baselines are stored relative to a calibration loop timed alongside each
+    benchmark, so they carry across machines and survive load spikes.
+    Run pytest with --update-baselines to record new baselines.
+    """
+    update = request.config.getoption("--update-baselines")
+    tolerance = request.config.getoption("--bench-tolerance")
+    baselines = _load_baselines()
+
+    def measure(fn, number):
+        per_call = min(timeit.repeat(fn, number=number, repeat=5)) / number
+        return per_call, per_call / _calibrate()
+
+    def run(name, fn, number=100):
+        fn()  # warm caches before timing
+        per_call, relative = measure(fn, number)
+
+        if update:
+            _new_baselines[name] = float(f"{relative:.4g}")
+            return per_call
+
+        baseline = baselines.get(name)
+        if baseline is None:
+            pytest.skip(f"No baseline for {name!r}; run pytest --update-baselines")
+
+        # A load spike can slow one measurement; only fail if it persists
+        for _ in range(BENCH_RETRIES):
+            if relative <= baseline * tolerance:
+                break
+            per_call, relative = min((per_call, relative), measure(fn, number), key=lambda m: m[1])
+
+        assert relative <= baseline * tolerance, (
+            f"{name}: {relative:.3f}x calibration vs baseline {baseline:.3f}x "
+            f"({per_call * 1e6:.1f} us/call, tolerance x{tolerance})"
+        )
+        return per_call
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _new_baselines:
+        return
+    baselines = _load_baselines()
+    baselines.update(_new_baselines)
+    os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+    with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(baselines.items())), f, indent=2)
+        f.write("\n")
@@ -0,0 +1,40 @@
+import pytest
+
+from simulator.audio.equalizer import Equalizer10Band
+from simulator.leds.patterns import blended_eq_pattern
+from simulator.effects import EFFECT_MAP
+
+CHUNK = 1024
+
+
+def test_bench_equalizer_process(benchmark, sample_rate, pink_noise):
+    eq = Equalizer10Band(sample_rate)
+    chunk = pink_noise(CHUNK)
+    benchmark("equalizer_process", lambda: eq.process(chunk), number=200)
+
+
+def test_bench_blended_eq_pattern(benchmark):
+    bands = [0.1 * i for i in range(10)]
+    benchmark("blended_eq_pattern_1000", lambda: blended_eq_pattern(bands, 1000), number=2000)
+
+
+@pytest.mark.parametrize("effect", EFFECT_MAP.values(), ids=lambda fn: fn.__name__)
+def test_bench_effect(benchmark, leds, effect):
+    benchmark(f"effect_{effect.__name__}", lambda: effect(leds, 0.1), number=500)
+
+
+@pytest.mark.parametrize("glow", [False, True], ids=["flat", "glow"])
+def test_bench_visualizer_draw(benchmark, make_visualizer, glow):
+    vis = make_visualizer(led_count=1000, strings=10, glow=glow)
+    vis.update_leds([(255, (i * 7) % 256, 64) for i in range(1000)])
+    benchmark(f"visualizer_draw_1000_{'glow' if glow else 'flat'}", vis.draw, number=10)
+
+
+@pytest.mark.parametrize("led_count", [3000, 5000])
+def test_bench_visualizer_draw_glow_large(request, benchmark, make_visualizer, led_count):
+    vis = make_visualizer(led_count=led_count, strings=50, glow=True)
+    vis._resize_window(1200, 900)
+    vis.update_leds([(255, (i * 7) % 256, 64) for i in range(led_count)])
+    per_call = benchmark(f"visualizer_draw_{led_count}_glow", vis.draw, number=5)
+    if request.config.getoption("--check-frame-budget"):
+        assert per_call < 1 / 60, f"{led_count} LEDs took {per_call * 1000:.1f} ms per frame"
@@ -0,0 +1,29 @@
+import pytest
+
+from simulator.effects import EFFECT_MAP
+from simulator.effects.oneshot import ripple_effect
+
+
+@pytest.mark.parametrize("name", list(EFFECT_MAP))
+@pytest.mark.parametrize("elapsed", [0.0, 0.1, 0.5, 1.0, 1.9])
+def test_effect_frame_shape(leds, name, elapsed):
+    colors, done = EFFECT_MAP[name](leds, elapsed)
+    assert len(colors) == len(leds)
+    assert isinstance(done, bool)
+    for color in colors:
+        assert len(color) == 3
+        assert all(0 <= c <= 255 for c in color)
+
+
+@pytest.mark.parametrize("name", list(EFFECT_MAP))
+def test_effect_finishes_dark(leds, name):
+    colors, done = EFFECT_MAP[name](leds, 10.0)
+    assert done
+    assert set(colors) == {(0, 0, 0)}
+
+
+def test_ripple_lights_a_ring(leds):
+    colors, done = ripple_effect(leds, 0.1)
+    assert not done
+    assert (255, 255, 255) in colors
+    assert (0, 0, 0) in colors
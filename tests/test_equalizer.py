@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+import pytest
+
+from simulator.audio.equalizer import Equalizer10Band
+
+CHUNK = 1024  # what main.py feeds per frame
+
+FFT_SIZE = 8192  # fine enough to resolve the 20-40 Hz band at 44.1 kHz
+
+
+@pytest.fixture
+def eq(sample_rate):
+    return Equalizer10Band(sample_rate, fft_size=FFT_SIZE)
+
+
+def test_output_shape_and_range(eq, pink_noise):
+    bands = eq.process(pink_noise(FFT_SIZE))
+    assert len(bands) == 10
+    assert all(0.0 <= b <= 1.0 for b in bands)
+    assert max(bands) == pytest.approx(1.0)
+
+
+def test_silence_is_dark(eq):
+    assert eq.process(np.zeros(FFT_SIZE, dtype=np.float32)) == [0.0] * 10
+
+
+def test_short_chunk_is_padded(eq, sine):
+    bands = eq.process(sine(1000, 512))
+    assert len(bands) == 10
+    assert int(np.argmax(bands)) == 5
+
+
+@pytest.mark.parametrize("band", range(10))
+def test_sine_lands_in_its_band(eq, sine, band):
+    low, high = eq.bands[band]
+    bands = eq.process(sine(math.sqrt(low * high), FFT_SIZE))
+    assert int(np.argmax(bands)) == band
+    assert bands[band] == pytest.approx(1.0)
+
+
+def test_sweep_moves_up_the_bands(eq, sine_sweep):
+    chunks = 10
+    signal = sine_sweep(20, 20000, FFT_SIZE * chunks)
+    peaks = [int(np.argmax(eq.process(signal[i * FFT_SIZE:(i + 1) * FFT_SIZE])))
+             for i in range(chunks)]
+    assert peaks == sorted(peaks)
+    assert peaks[0] <= 1 and peaks[-1] == 9
+
+
+def test_pink_noise_tilts_toward_bass(eq, pink_noise):
+    noise = pink_noise(FFT_SIZE * 8)
+    bands = np.mean([eq.process(noise[i * FFT_SIZE:(i + 1) * FFT_SIZE]) for i in range(8)], axis=0)
+    assert all(b > 0 for b in bands)
+    assert bands[2] > bands[5] > bands[9]
+
+
+@pytest.mark.parametrize("sr", [44100, 48000])
+def test_every_band_has_bins_at_production_fft_size(sr):
+    eq = Equalizer10Band(sr)
+    for (low, high), idx in zip(eq.bands, eq.band_bins):
+        assert len(idx) > 0, f"{low}-{high} Hz has no FFT bins at fft_size={eq.fft_size}"
+        assert np.all((eq.freqs[idx] >= low) & (eq.freqs[idx] < high))
+
+
+@pytest.mark.parametrize("band", range(10))
+def test_production_chunks_light_each_band(sample_rate, sine, band):
+    eq = Equalizer10Band(sample_rate)
+    low, high = eq.bands[band]
+    signal = sine(math.sqrt(low * high), eq.fft_size * 2)
+    for start in range(0, len(signal), CHUNK):
+        bands = eq.process(signal[start:start + CHUNK])
+    assert int(np.argmax(bands)) == band
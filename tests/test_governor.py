@@ -0,0 +1,112 @@
+import pytest
+
+from simulator.leds.glow import DOWNSAMPLE
+from simulator.sync.governor import QUALITY_LEVELS, FrameGovernor, frame_budget
+
+
+def test_frame_budget_takes_tighter_limit():
+    assert frame_budget(1024, 44100, render_fps=60) == pytest.approx(1 / 60)
+    assert frame_budget(1024, 44100, render_fps=30) == pytest.approx(1024 / 44100)
+    assert frame_budget(1024, 44100, render_fps=None) == pytest.approx(1024 / 44100)
+
+
+def test_steady_load_stays_at_full_quality():
+    gov = FrameGovernor(0.016)
+    for _ in range(200):
+        assert not gov.record(0.012)
+    assert gov.level == 0
+    assert gov.settings["name"] == "full"
+
+
+def test_overload_steps_down_and_logs():
+    gov = FrameGovernor(0.016, downgrade_after=5)
+    changed = [gov.record(0.030) for _ in range(5)]
+    assert changed == [False] * 4 + [True]
+    assert gov.level == 1
+    decision = gov.decisions[-1]
+    assert decision["from"] == "full" and decision["to"] == "no-labels"
+    assert decision["reason"] == "over budget"
+
+
+def test_sustained_overload_bottoms_out():
+    gov = FrameGovernor(0.016)
+    for _ in range(500):
+        gov.record(0.050)
+    assert gov.level == len(QUALITY_LEVELS) - 1
+    assert not gov.settings["glow"] and not gov.settings["labels"]
+
+
+def test_headroom_steps_back_up():
+    gov = FrameGovernor(0.016, downgrade_after=1, upgrade_after=10)
+    gov.record(0.050)
+    assert gov.level == 1
+    for _ in range(200):
+        gov.record(0.002)
+    assert gov.level == 0
+    assert gov.decisions[-1]["reason"] == "headroom"
+
+
+def test_failed_upgrade_backs_off():
+    gov = FrameGovernor(0.016, downgrade_after=1, upgrade_after=10, smoothing=1.0)
+    gov.record(0.050)
+    for _ in range(10):
+        gov.record(0.002)
+    assert gov.level == 0
+    gov.record(0.050)
+    assert gov.level == 1
+    assert gov.stats()["upgrade_wait"] == 20
+
+    for _ in range(19):
+        gov.record(0.002)
+    assert gov.level == 1
+    gov.record(0.002)
+    assert gov.level == 0
+
+
+def test_no_level_changes_fft_size():
+    # Smaller FFTs leave the bass bands without bins; audio is never degraded
+    assert all("fft_size" not in level for level in QUALITY_LEVELS)
+
+
+def test_full_quality_uses_default_glow_resolution():
+    assert QUALITY_LEVELS[0]["glow_downsample"] == DOWNSAMPLE
+
+
+def test_downgrade_stops_once_new_level_fits():
+    gov = FrameGovernor(0.016)
+    for _ in range(200):
+        gov.record(0.040 if gov.level < 2 else 0.012)
+    assert gov.settings["name"] == "coarse-glow"
+    assert len(gov.decisions) == 2
+    assert gov.frame_time == pytest.approx(0.012)
+
+
+def test_late_downgrade_does_not_back_off():
+    gov = FrameGovernor(0.016, downgrade_after=1, upgrade_after=10, smoothing=1.0, retry_window=5)
+    gov.record(0.050)
+    for _ in range(10):
+        gov.record(0.002)
+    assert gov.level == 0
+    for _ in range(20):
+        gov.record(0.012)
+    gov.record(0.050)
+    assert gov.level == 1
+    assert gov.stats()["upgrade_wait"] == 10
+
+
+def test_backoff_decays_after_upgrade_holds():
+    gov = FrameGovernor(0.016, downgrade_after=1, upgrade_after=10, smoothing=1.0, retry_window=5)
+    gov.record(0.050)
+    for _ in range(3):
+        for _ in range(gov.stats()["upgrade_wait"]):
+            gov.record(0.002)
+        assert gov.level == 0
+        gov.record(0.050)
+    assert gov.stats()["upgrade_wait"] == 80
+
+    for _ in range(80):
+        gov.record(0.002)
+    assert gov.level == 0
+    for _ in range(6):
+        gov.record(0.012)
+    assert gov.stats()["upgrade_wait"] == 40
@@ -1 +1,71 @@
+import pytest
 
+from simulator.leds.timing import (
+    string_refresh_time,
+    max_leds_per_channel,
+    partition_strings,
+    channel_led_indices,
+    TargetRateError,
+    main,
+)
+
+
+def test_string_refresh_time_ws2812():
+    # 100 LEDs * 30us + 280us reset
+    assert string_refresh_time(100) == pytest.approx(0.00328)
+
+
+def test_partition_balances_channels():
+    string_map = [("a", 0, 300), ("b", 300, 200), ("c", 500, 100)]
+    plan = partition_strings(string_map, 2)
+    counts = sorted(sum(c for _, _, c in ch) for ch in plan["channels"])
+    assert counts == [300, 300]
+    assert plan["fps"] == pytest.approx(1.0 / string_refresh_time(300))
+
+
+def test_partition_splits_long_strings_for_target():
+    string_map = [("cape", 0, 2000)]
+    plan = partition_strings(string_map, 4, target_fps=60)
+    assert plan["meets_target"]
+    segments = [s for ch in plan["channels"] for s in ch]
+    assert all(count <= max_leds_per_channel(60) for _, _, count in segments)
+    assert sum(count for _, _, count in segments) == 2000
+
+
+def test_channel_led_indices_follow_plan():
+    plan = partition_strings([("a", 0, 10), ("b", 10, 5)], 2)
+    assert channel_led_indices(plan, 15) == [list(range(10)), list(range(10, 15))]
+
+
+def test_cli_handles_empty_apa102_string(tmp_path, monkeypatch, capsys):
+    cfg = tmp_path / "layout.json"
+    cfg.write_text('{"strings": [{"name": "empty", "leds": []}]}', encoding="utf-8")
+    monkeypatch.setattr("sys.argv", ["timing", str(cfg), "--protocol", "apa102"])
+    main()
+    assert "empty: 0 LEDs" in capsys.readouterr().out
+
+
+def test_cli_warns_when_target_fps_is_impossible(tmp_path, monkeypatch, capsys):
+    cfg = tmp_path / "layout.json"
+    cfg.write_text('{"strings": [{"name": "a", "leds": [{"x": 0, "y": 0}]}]}', encoding="utf-8")
+    monkeypatch.setattr("sys.argv", ["timing", str(cfg), "--fps", "10000"])
+    main()
+    out = capsys.readouterr().out
+    assert "[WARN] Target frame rate is too high" in out
+    assert "Cannot reach" in out
+
+
+def test_unreachable_target_raises_target_rate_error():
+    with pytest.raises(TargetRateError):
+        partition_strings([("a", 0, 10)], 1, target_fps=10000)
+
+
+@pytest.mark.parametrize("extra", [["--channels", "0"], ["--channels", "-1", "--fps", "60"]])
+def test_cli_rejects_bad_channel_counts(tmp_path, monkeypatch, capsys, extra):
+    cfg = tmp_path / "layout.json"
+    cfg.write_text('{"strings": []}', encoding="utf-8")
+    monkeypatch.setattr("sys.argv", ["timing", str(cfg)] + extra)
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
@@ -0,0 +1,24 @@
+from simulator.leds.eq_colors import get_eq_band_colors
+from simulator.leds.patterns import blend_bands_to_led_color, blended_eq_pattern
+
+
+def test_silent_bands_are_black():
+    assert blend_bands_to_led_color([0.0] * 10, get_eq_band_colors()) == (0, 0, 0)
+
+
+def test_single_band_gives_its_color():
+    colors = get_eq_band_colors()
+    for band, color in enumerate(colors):
+        energies = [0.0] * 10
+        energies[band] = 1.0
+        assert blend_bands_to_led_color(energies, colors) == color
+
+
+def test_blend_is_clamped():
+    assert blend_bands_to_led_color([1.0] * 10, get_eq_band_colors()) == (255, 255, 255)
+
+
+def test_pattern_length():
+    leds = blended_eq_pattern([0.5] * 10, led_count=37)
+    assert len(leds) == 37
+    assert len(set(leds)) == 1
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+
+
+def test_config_builds_string_map(make_visualizer):
+    vis = make_visualizer(led_count=40, strings=4)
+    assert len(vis.leds) == 40
+    assert vis.string_map == [(f"string{s}", s * 10, 10) for s in range(4)]
+
+
+def test_update_leds_ignores_extra_colors(make_visualizer):
+    vis = make_visualizer(led_count=8, strings=1)
+    vis.update_leds([(255, 0, 0)] * 20)
+    assert all(led["color"] == (255, 0, 0) for led in vis.leds)
+
+
+@pytest.mark.parametrize("glow", [False, True])
+@pytest.mark.parametrize("paused", [False, True])
+def test_draw_headless(make_visualizer, glow, paused):
+    vis = make_visualizer(led_count=40, glow=glow)
+    vis.shared.is_paused = paused
+    vis.update_leds([(255, 128, 0)] * 40)
+    vis.draw()
+    assert vis.slider_rect is not None
+    assert "pause" in vis.button_rects
+
+
+def test_glow_lights_around_led(make_visualizer):
+    vis = make_visualizer(led_count=4, strings=1, glow=True)
+    vis.update_leds([(255, 0, 0)] * 4)
+    vis.draw()
+    x, y = vis._led_screen_position(vis.leds[1])
+    r, g, b, _ = vis.screen.get_at((x, y))
+    assert r > 200 and g == 0 and b == 0
+
+
+def test_latency_sim_delays_updates(make_visualizer):
+    vis = make_visualizer(led_count=40, strings=4)
+    plan = vis.simulate_latency(channels=2)
+    assert len(plan["channels"]) == 2
+    vis.update_leds([(255, 255, 255)] * 40)
+    vis.draw()
+    assert all(led["color"] == (0, 0, 0) for led in vis.leds)
+
+    vis.simulate_latency(channels=0)
+    vis.update_leds([(255, 255, 255)] * 40)
+    assert all(led["color"] == (255, 255, 255) for led in vis.leds)
+
+
+def test_latency_sim_channels_tear(make_visualizer, monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr("simulator.leds.visualizer.time", SimpleNamespace(perf_counter=lambda: clock.now))
+
+    # Four 100-LED strings on three channels: one carries 200 LEDs, two carry 100
+    vis = make_visualizer(led_count=400, strings=4)
+    plan = vis.simulate_latency(channels=3)
+    slow = plan["channel_times"].index(max(plan["channel_times"]))
+    fast = plan["channel_times"].index(min(plan["channel_times"]))
+    slow_led = vis.leds[plan["channels"][slow][0][1]]
+    fast_led = vis.leds[plan["channels"][fast][0][1]]
+    t_slow, t_fast = plan["channel_times"][slow], plan["channel_times"][fast]
+    assert t_slow > 1.5 * t_fast
+
+    red, green = (255, 0, 0), (0, 255, 0)
+
+    clock.now = 0.1 * t_fast
+    vis.update_leds([red] * 400)
+    # The fast channel has sent and latched red; the slow one is still mid-frame
+    clock.now = 2.1 * t_fast
+    vis.draw()
+    assert fast_led["color"] == red
+    assert slow_led["color"] == (0, 0, 0)
+
+    # Green arrives after the slow channel started its next transmission,
+    # so the slow channel latches red while the fast one moves on to green
+    clock.now = t_slow + 0.1 * t_fast
+    vis.update_leds([green] * 400)
+    clock.now = 2 * t_slow + 0.5 * t_fast
+    vis.draw()
+    assert fast_led["color"] == green
+    assert slow_led["color"] == red
+
+
+def test_apply_quality_drops_glow_and_restores_it(make_visualizer):
+    vis = make_visualizer(led_count=8, strings=1, glow=True)
+    vis.apply_quality({"labels": False, "glow": True, "glow_downsample": 12})
+    assert vis.glow.downsample == 12 and not vis.show_labels
+    vis.apply_quality({"labels": False, "glow": False})
+    assert vis.glow is None
+    vis.shared.is_paused = True
+    vis.draw()
+
+    vis.apply_quality({"labels": True, "glow": True, "glow_downsample": 6})
+    assert vis.glow is not None and vis.glow.downsample == 6 and vis.show_labels
+
+
+def test_background_is_rescaled_only_on_resize(make_visualizer):
+    vis = make_visualizer(led_count=8, strings=1)
+    vis.draw()
+    cached = vis._scaled_bg
+    vis.draw()
+    assert vis._scaled_bg is cached
+    vis._resize_window(1200, 900)
+    vis.draw()
+    assert vis._scaled_bg is not cached
+
+
+def test_apply_quality_never_enables_unrequested_glow(make_visualizer):
+    vis = make_visualizer(led_count=8, strings=1, glow=False)
+    vis.apply_quality({"glow": True})
+    assert vis.glow is None
@@ -1,13 +1,24 @@
 import time
 from simulator.leds.visualizer import LEDVisualizer
 
-vis = LEDVisualizer(led_count=24)
 
-colors = [(255, 0, 0)] * 24  # Red test
+class DemoState:
+    seek_position = 0.0
+    current_track_name = "visualizer_test"
+    is_paused = False
+    edit_mode = False
+    in_effect = False
+
+
+vis = LEDVisualizer(DemoState())
+
+colors = [(255, 0, 0)] * len(vis.leds)  # Red test
 
 running = True
 start = time.time()
 
 while running and time.time() - start < 5:
-    running = vis.handle_events()
-    vis.update(colors)
+    clicked, _ = vis.handle_events()
+    running = clicked != "exit"
+    vis.update_leds(colors)
+    vis.draw()